@@ -1,7 +1,13 @@
+import hashlib
+import io
+import os
+import time
+from types import MappingProxyType
+
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np  # included for requirements.txt consistency
+import numpy as np
+from pandas.api.types import union_categoricals
 
 st.set_page_config(page_title="Juice & Smoothie Sales Dashboard", layout="wide")
 
@@ -20,23 +26,503 @@ uploaded_file = st.file_uploader(
     type=["csv", "xlsx"]
 )
 
-def detect_column(df, candidates):
+# Candidate column names (already lower-cased) for the columns the dashboard needs.
+# Adjust these if your dataset uses slightly different labels.
+CATEGORY_CANDIDATES = ("category", "product category")
+SALES_CANDIDATES = ("$ sales", "sales ($)", "sales", "total sales")
+DATE_CANDIDATES = ("date ordered", "order date")
+SATISFACTION_CANDIDATES = ("service satisfaction rating", "satisfaction rating")
+
+COLUMN_CANDIDATES = {
+    "category": CATEGORY_CANDIDATES,
+    "sales": SALES_CANDIDATES,
+    "date": DATE_CANDIDATES,
+    "satisfaction": SATISFACTION_CANDIDATES,
+}
+# Every candidate name mapped to the column it identifies and its position in
+# that column's candidate list (earlier candidates are preferred). Built once
+# at import and read-only, so lookups never touch the candidate strings again.
+CANDIDATE_LOOKUP = MappingProxyType({
+    cand: (target, rank)
+    for target, candidates in COLUMN_CANDIDATES.items()
+    for rank, cand in enumerate(candidates)
+})
+
+# CSV uploads larger than this are read in chunks of CSV_CHUNK_ROWS rows, keeping
+# only the columns the dashboard uses
+LARGE_CSV_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 250_000
+
+def detect_columns(columns):
+    """
+    Find the category, sales, date and satisfaction columns in one pass over the
+    column names. Returns a dict with those keys; a value is None if no column
+    matched. When several columns match, the earliest candidate name wins.
+    """
+    found = {}
+    for col in columns:
+        match = CANDIDATE_LOOKUP.get(col.lower())
+        if match is not None:
+            target, rank = match
+            if target not in found or rank < found[target][0]:
+                found[target] = (rank, col)
+    return {target: found[target][1] if target in found else None for target in COLUMN_CANDIDATES}
+
+# Parsed uploads are also kept as Parquet files in a private per-user directory.
+# Bump PARQUET_CACHE_VERSION whenever parse_upload, prepare_columns or
+# detect_columns change what they produce, so older copies are not reused.
+PARQUET_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "juice-sales-dashboard")
+PARQUET_CACHE_VERSION = 1
+PARQUET_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+PARQUET_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+@st.cache_data(show_spinner=False)
+def load_dataframe(name: str, data: bytes) -> pd.DataFrame:
+    """
+    Load the uploaded file into a DataFrame.
+    Cached on the file name and contents so reruns skip re-reading the file.
+    The parsed table is also saved as Parquet, so if the cache entry is dropped
+    the same upload is reloaded without parsing it again.
+    """
+    cache_dir = parquet_cache_dir()
+    if cache_dir is None:
+        return parse_upload(name, data)
+
+    digest = hashlib.sha256(data).hexdigest()
+    parquet_path = os.path.join(
+        cache_dir,
+        f"v{PARQUET_CACHE_VERSION}-{os.path.splitext(name)[1][1:]}-{digest}.parquet",
+    )
+    if os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+            os.utime(parquet_path)  # mark as recently used for prune_parquet_cache
+            return df
+        except (ImportError, OSError, ValueError):
+            pass  # unreadable copy; parse the upload again
+
+    df = parse_upload(name, data)
+
+    # Saving the copy is best effort: it needs pyarrow and a writable cache
+    # directory, and the dashboard works without it
+    partial_path = f"{parquet_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(partial_path, engine="pyarrow", compression="zstd")
+        os.replace(partial_path, parquet_path)
+    except (ImportError, OSError, TypeError, ValueError):
+        try:
+            os.remove(partial_path)
+        except OSError:
+            pass
+    prune_parquet_cache(cache_dir)
+    return df
+
+def parquet_cache_dir():
+    """
+    Create the Parquet cache directory (readable by this user only) if needed.
+    Returns None if it cannot be created, or if it is not owned by this user or
+    others can access it, in which case nothing is cached on disk.
+    """
+    try:
+        os.makedirs(PARQUET_CACHE_DIR, mode=0o700, exist_ok=True)
+        info = os.stat(PARQUET_CACHE_DIR)
+    except OSError:
+        return None
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+        return None
+    return PARQUET_CACHE_DIR
+
+def prune_parquet_cache(cache_dir):
     """
-    Try to find a matching column name from a list of candidate names.
-    Returns the first match or None if no match is found.
+    Delete Parquet copies from older cache versions or older than
+    PARQUET_CACHE_MAX_AGE, then the least recently used ones until the rest fit
+    in PARQUET_CACHE_MAX_BYTES.
     """
-    cols_lower = {c.lower(): c for c in df.columns}
-    for cand in candidates:
-        if cand.lower() in cols_lower:
-            return cols_lower[cand.lower()]
-    return None
+    now = time.time()
+    kept = []
+    for entry in os.scandir(cache_dir):
+        try:
+            info = entry.stat()
+            if (not entry.name.startswith(f"v{PARQUET_CACHE_VERSION}-")
+                    or now - info.st_mtime > PARQUET_CACHE_MAX_AGE):
+                os.remove(entry.path)
+            elif entry.name.endswith(".parquet"):
+                kept.append((info.st_mtime, info.st_size, entry.path))
+        except OSError:
+            continue
+
+    total = 0
+    for _, size, path in sorted(kept, reverse=True):
+        total += size
+        if total > PARQUET_CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def parse_upload(name: str, data: bytes) -> pd.DataFrame:
+    """Parse the uploaded CSV or Excel file into a DataFrame."""
+    if name.endswith(".csv") and len(data) > LARGE_CSV_BYTES:
+        return read_large_csv(data)
+    if name.endswith(".csv"):
+        # The pyarrow parser is multi-threaded and much faster on large files, but
+        # it is stricter (e.g. rejects rows with missing trailing fields), so any
+        # file it cannot read goes through the default parser
+        try:
+            df = pd.read_csv(io.BytesIO(data), engine="pyarrow")
+        except (ImportError, ValueError):
+            df = pd.read_csv(io.BytesIO(data))
+    else:
+        # calamine (Rust) is much faster than openpyxl when python-calamine is installed
+        try:
+            df = pd.read_excel(io.BytesIO(data), engine="calamine")
+        except (ImportError, ValueError):
+            df = pd.read_excel(io.BytesIO(data))
+    return prepare_columns(df)
+
+def read_large_csv(data: bytes) -> pd.DataFrame:
+    """
+    Read a large CSV chunk by chunk, keeping only the columns the dashboard uses.
+    Each chunk is shrunk by prepare_columns before the next one is read, so the
+    full table is never held in memory at once.
+    """
+    header = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    found = detect_columns(header)
+    usecols = [col for col in header if col in found.values()]
+
+    # Category and date are read as strings in every chunk: a chunk where they
+    # are all blank would otherwise be read as float, and union_categoricals
+    # below needs the same category dtype in every chunk
+    # The ratings are read as strings too and only converted once all chunks are
+    # in: deciding numeric-or-text per chunk could leave a mix of both
+    text_dtypes = {
+        found[key]: "string"
+        for key in ("category", "date", "satisfaction")
+        if found[key] is not None
+    }
+
+    # The pyarrow engine cannot read in chunks, so this uses the default C parser
+    chunks = [
+        prepare_columns(chunk, ratings=False)
+        for chunk in pd.read_csv(
+            io.BytesIO(data), usecols=usecols, dtype=text_dtypes, chunksize=CSV_CHUNK_ROWS
+        )
+    ]
+    if not chunks:
+        return pd.DataFrame(columns=usecols)
+
+    # Chunks can have different categories, which pd.concat would turn back into
+    # strings, so categorical columns are combined with union_categoricals
+    columns = {}
+    for col in usecols:
+        parts = [chunk[col] for chunk in chunks]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[col] = union_categoricals(parts)
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    df = pd.DataFrame(columns)
+    if found["satisfaction"] is not None:
+        prepare_ratings(df, found["satisfaction"])
+    return df
 
-if uploaded_file is not None:
-    # Read the uploaded file
-    if uploaded_file.name.endswith(".csv"):
-        df = pd.read_csv(uploaded_file)
+def prepare_columns(df: pd.DataFrame, ratings: bool = True) -> pd.DataFrame:
+    """
+    Convert the dashboard columns to compact types for faster aggregation.
+    With ratings=False the satisfaction column is left for the caller to convert
+    with prepare_ratings.
+    """
+    columns = detect_columns(df.columns)
+
+    # Store the category as a pandas categorical so grouping uses integer codes
+    # instead of hashing every string
+    category_col = columns["category"]
+    if category_col is not None:
+        df[category_col] = df[category_col].astype("category")
+
+    # Use the smallest numeric types that hold the values (float32 sales, int8
+    # ratings) so the aggregations read half as much memory or less
+    sales_col = columns["sales"]
+    if sales_col is not None:
+        df[sales_col] = pd.to_numeric(df[sales_col], errors="coerce", downcast="float")
+    if ratings and columns["satisfaction"] is not None:
+        prepare_ratings(df, columns["satisfaction"])
+
+    # Text dates repeat across orders, so store each distinct date string once
+    date_col = columns["date"]
+    if date_col is not None and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = df[date_col].astype("category")
+    return df
+
+# Below this many rows the pandas groupby on category codes is fast enough that
+# compiling the numba kernel (a few seconds) would only slow the first load down
+GROUP_SUM_KERNEL_ROWS = 1_000_000
+
+def prepare_ratings(df: pd.DataFrame, satisfaction_col) -> None:
+    """
+    Convert the satisfaction ratings to the smallest numeric type, in place.
+    Only done if nothing is lost: text ratings such as "Good"/"Bad" would all
+    become NaN, so those are left as they are.
+    """
+    ratings = pd.to_numeric(df[satisfaction_col], errors="coerce")
+    if ratings.notna().sum() != df[satisfaction_col].notna().sum():
+        return
+    if isinstance(ratings.dtype, pd.api.extensions.ExtensionDtype):
+        # Strings convert to nullable integers; use NumPy floats (NaN) like a
+        # column read straight from the file, so np.bincount can be used later
+        ratings = ratings.astype(np.float64)
+    df[satisfaction_col] = pd.to_numeric(ratings, downcast="integer")
+
+@st.cache_resource(show_spinner=False)
+def load_group_sum_kernel():
+    """
+    Build the numba group-sum kernel on first use.
+    numba is slow to import and compile, so it is only loaded for datasets of at
+    least GROUP_SUM_KERNEL_ROWS rows, and the compiled kernel is kept across reruns.
+    Returns None if numba is not installed (the pandas groupby is used instead).
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    # Single-threaded on purpose: Streamlit runs every session's script on its
+    # own worker thread, and numba's parallel threading layers either hang the
+    # process at exit (TBB, first used off the main thread) or abort on
+    # concurrent calls (workqueue)
+    @njit
+    def group_sum(codes, values, n_groups):
+        """
+        Sum values per group code in one pass over the arrays.
+        Negative codes (missing group) and missing values are skipped.
+        """
+        totals = np.zeros(n_groups)
+        for i in range(codes.size):
+            if codes[i] >= 0 and not np.isnan(values[i]):
+                totals[codes[i]] += values[i]
+        return totals
+
+    return group_sum
+
+@st.cache_data(show_spinner=False)
+def compute_category_sales(df, category_col, sales_col):
+    """Total sales per category, largest first."""
+    categories = df[category_col]
+    group_sum = load_group_sum_kernel() if len(df) >= GROUP_SUM_KERNEL_ROWS else None
+    if group_sum is not None and isinstance(categories.dtype, pd.CategoricalDtype):
+        totals = group_sum(
+            categories.cat.codes.to_numpy(),
+            df[sales_col].to_numpy(),
+            len(categories.cat.categories),
+        )
+        return pd.Series(
+            totals,
+            index=pd.Index(categories.cat.categories, name=category_col),
+            name=sales_col,
+        ).sort_values(ascending=False)
+
+    return (
+        df.groupby(category_col, observed=True)[sales_col]
+        .sum()
+        .sort_values(ascending=False)
+    )
+
+def parse_days(values):
+    """
+    Parse date values into day numbers (days since 1970-01-01), with NaT for
+    values that are not dates.
+    """
+    parsed = pd.to_datetime(values, errors="coerce", cache=True)
+    if parsed.tz is not None:
+        # Count orders on their local calendar day; converting to day numbers
+        # would otherwise go through UTC and can move them to another day
+        parsed = parsed.tz_localize(None)
+    return parsed.to_numpy(dtype="datetime64[D]").view(np.int64)
+
+@st.cache_data(show_spinner=False)
+def compute_daily_sales(df, date_col, sales_col):
+    """Total sales per day, with rows whose date cannot be parsed dropped."""
+    # Convert date column to day numbers, parsing each distinct date only once
+    # (sales data repeats the same dates across many orders)
+    nat = np.iinfo(np.int64).min
+    dates = df[date_col]
+    if isinstance(dates.dtype, pd.CategoricalDtype):
+        # Text dates are stored as categories, which already are the distinct dates
+        codes, unique_dates = dates.cat.codes.to_numpy(), dates.cat.categories
     else:
-        df = pd.read_excel(uploaded_file)
+        codes, unique_dates = pd.factorize(dates)
+    # Look each row up by its code; code -1 (missing) picks the NaT appended at the end
+    days = np.append(parse_days(unique_dates), nat)[codes]
+
+    # Drop rows where the date failed to convert (NaT)
+    valid = days != nat
+    days = days[valid]
+    if days.size == 0:
+        return pd.Series(dtype=np.float64, name=sales_col,
+                         index=pd.DatetimeIndex([], name=date_col))
+
+    # Sum sales per day as a weighted histogram over day numbers, which comes
+    # out already sorted by date; missing sales count as 0 like in a groupby sum
+    min_day = days.min()
+    day_idx = days - min_day
+    sales = np.nan_to_num(df[sales_col].to_numpy(dtype=np.float64)[valid])
+    totals = np.bincount(day_idx, weights=sales)
+
+    # Keep only the days that had orders
+    seen = np.flatnonzero(np.bincount(day_idx))
+    index = pd.DatetimeIndex((seen + min_day).astype("datetime64[D]"), name=date_col)
+    return pd.Series(totals[seen], index=index, name=sales_col)
+
+# Ratings above this are not a small score scale (e.g. a data-entry error), so they
+# are counted with value_counts instead of a bincount histogram
+MAX_BINCOUNT_RATING = 100
+
+def clean_ratings(ratings):
+    """
+    Return the non-missing ratings as a contiguous int64 array.
+    Returns None unless they are whole numbers from 0 to MAX_BINCOUNT_RATING,
+    which np.bincount needs (it allocates one slot per value up to the maximum).
+    """
+    values = ratings.to_numpy()
+    if values.dtype.kind == "f":
+        values = values[~np.isnan(values)]
+        if not np.array_equal(values, np.floor(values)):
+            return None
+    elif values.dtype.kind not in "iu":
+        return None
+    if values.size and (values.min() < 0 or values.max() > MAX_BINCOUNT_RATING):
+        return None
+    return values.astype(np.int64)
+
+@st.cache_data(show_spinner=False)
+def compute_rating_counts(df, satisfaction_col):
+    """Number of customers per satisfaction rating, ordered by rating."""
+    ratings = df[satisfaction_col]
+    values = clean_ratings(ratings)
+    if values is None:
+        # Not whole-number scores, so fall back to hashing the values
+        return ratings.dropna().value_counts().sort_index()
+
+    # Count each rating (e.g., 1–5) with a histogram indexed by the score itself
+    counts = np.bincount(values)
+    scores = np.flatnonzero(counts)
+    return pd.Series(counts[scores], index=pd.Index(scores, name=satisfaction_col), name="count")
+
+# ============= TAB 1: CATEGORY SALES COMPARISON =============
+@st.fragment
+def render_category_tab(df, category_col, sales_col):
+    """Question 1: total sales per category with a short interpretation."""
+    st.subheader("Question 1: Compare Sales Performance – Juices vs Smoothies")
+
+    if category_col is not None and sales_col is not None:
+        # Group by category and sum sales
+        category_sales = compute_category_sales(df, category_col, sales_col)
+
+        # Native Streamlit charts are drawn in the browser instead of being
+        # rendered to an image on the server
+        st.markdown("**Total Sales by Category**")
+        st.bar_chart(category_sales, x_label="Product Category", y_label="Total Sales ($)")
+
+        # Interpretation text
+        if not category_sales.empty:
+            top_category = category_sales.idxmax()
+            top_value = category_sales.max()
+            total_sales = category_sales.sum()
+            if total_sales > 0:
+                top_pct = (top_value / total_sales) * 100
+            else:
+                top_pct = 0
+
+            st.markdown("**Brief Interpretation**")
+            st.write(
+                f"- The category **{top_category}** generates the highest revenue, "
+                f"contributing approximately **{top_pct:.1f}%** of total sales.\n"
+                f"- This suggests that customers spend more money on **{top_category}** "
+                "compared to the other category.\n"
+                "- Management could prioritize promotions, inventory, and marketing around "
+                f"**{top_category}** while exploring why the other category is underperforming."
+            )
+        else:
+            st.info("No sales data found after grouping by category.")
+    else:
+        st.error(
+            "Unable to create the category comparison chart because the required columns "
+            "were not found. Please check that your dataset has 'Category' and '$ Sales' "
+            "or 'Sales' columns."
+        )
+
+# ============= TAB 2: SALES OVER TIME (TIME SERIES) =============
+@st.fragment
+def render_daily_sales_tab(df, date_col, sales_col):
+    """Question 2: daily sales trend with a short interpretation."""
+    st.subheader("Question 2: Sales Over Timeline (Daily Sales Trends)")
+
+    if date_col is not None and sales_col is not None:
+        daily_sales = compute_daily_sales(df, date_col, sales_col)
+
+        if not daily_sales.empty:
+            st.markdown("**Daily Sales Over Time**")
+            st.line_chart(daily_sales, x_label="Date Ordered", y_label="Total Sales ($)")
+
+            st.markdown("**Brief Interpretation**")
+
+            # Basic interpretation: find peaks and overall trend
+            max_date = daily_sales.idxmax()
+            max_value = daily_sales.max()
+            st.write(
+                f"- The highest daily sales occurred on **{max_date.date()}**, "
+                f"with total sales of approximately **${max_value:,.2f}**.\n"
+                "- The chart helps identify busy days, potential promotion effects, or "
+                "seasonal patterns.\n"
+                "- Management can use this to schedule staffing, plan inventory, and "
+                "target marketing campaigns around high-demand periods."
+            )
+        else:
+            st.info("No valid daily sales data after processing the dates.")
+    else:
+        st.error(
+            "Unable to create the time-series chart because the required columns "
+            "('Date Ordered' and 'Sales') were not found."
+        )
+
+# ============= TAB 3: SERVICE SATISFACTION DISTRIBUTION =============
+@st.fragment
+def render_satisfaction_tab(df, satisfaction_col):
+    """Question 3: distribution of satisfaction ratings with a short interpretation."""
+    st.subheader("Question 3: Service Satisfaction Rating Distribution")
+
+    if satisfaction_col is not None:
+        rating_counts = compute_rating_counts(df, satisfaction_col)
+
+        if not rating_counts.empty:
+            st.markdown("**Service Satisfaction Rating Distribution**")
+            st.bar_chart(
+                rating_counts.set_axis(rating_counts.index.astype(str)),
+                x_label="Rating Score",
+                y_label="Number of Customers",
+            )
+
+            most_common_rating = rating_counts.idxmax()
+            st.markdown("**Brief Interpretation**")
+            st.write(
+                f"- The most common service satisfaction score is **{most_common_rating}**.\n"
+                "- A higher concentration of ratings at the top end (e.g., 4–5) indicates "
+                "good customer experience and service quality.\n"
+                "- If there are many low ratings (1–2), management should investigate "
+                "pain points such as waiting times, staff behavior, or product quality.\n"
+                "- This chart supports decisions on staff training, process improvement, "
+                "and customer service policies."
+            )
+        else:
+            st.info("No non-missing satisfaction ratings available in the dataset.")
+    else:
+        st.error(
+            "Unable to plot satisfaction distribution because the column "
+            "'Service Satisfaction Rating' (or similar) was not found."
+        )
+
+if uploaded_file is not None:
+    # Read the uploaded file (cached across reruns)
+    df = load_dataframe(uploaded_file.name, uploaded_file.getvalue())
 
     st.success("File uploaded successfully!")
 
@@ -47,11 +533,11 @@ if uploaded_file is not None:
     st.dataframe(df.tail())
 
     # ---- DETECT IMPORTANT COLUMNS ----
-    # Adjust these candidate names if your dataset uses slightly different labels
-    category_col = detect_column(df, ["Category", "Product Category"])
-    sales_col = detect_column(df, ["$ Sales", "Sales ($)", "Sales", "Total Sales"])
-    date_col = detect_column(df, ["Date Ordered", "Order Date"])
-    satisfaction_col = detect_column(df, ["Service Satisfaction Rating", "Satisfaction Rating"])
+    columns = detect_columns(df.columns)
+    category_col = columns["category"]
+    sales_col = columns["sales"]
+    date_col = columns["date"]
+    satisfaction_col = columns["satisfaction"]
 
     if category_col is None:
         st.warning("⚠ Could not automatically detect the **Category** column. "
@@ -69,144 +555,16 @@ if uploaded_file is not None:
     # ---- TABS FOR BONUS QUESTION ----
     tab1, tab2, tab3 = st.tabs(["Category Sales", "Sales Over Time", "Satisfaction Ratings"])
 
-    # ============= TAB 1: CATEGORY SALES COMPARISON =============
+    # Each tab is rendered in its own fragment so interactions inside one tab
+    # only rerun that tab
     with tab1:
-        st.subheader("Question 1: Compare Sales Performance – Juices vs Smoothies")
-
-        if category_col is not None and sales_col is not None:
-            # Group by category and sum sales
-            category_sales = (
-                df.groupby(category_col)[sales_col]
-                .sum()
-                .sort_values(ascending=False)
-            )
-
-            fig, ax = plt.subplots()
-            ax.bar(category_sales.index, category_sales.values)
-            ax.set_title("Total Sales by Category")
-            ax.set_xlabel("Product Category")
-            ax.set_ylabel("Total Sales ($)")
-            plt.xticks(rotation=0)
-
-            st.pyplot(fig)
-
-            # Interpretation text
-            if not category_sales.empty:
-                top_category = category_sales.idxmax()
-                top_value = category_sales.max()
-                total_sales = category_sales.sum()
-                if total_sales > 0:
-                    top_pct = (top_value / total_sales) * 100
-                else:
-                    top_pct = 0
-
-                st.markdown("**Brief Interpretation**")
-                st.write(
-                    f"- The category **{top_category}** generates the highest revenue, "
-                    f"contributing approximately **{top_pct:.1f}%** of total sales.\n"
-                    f"- This suggests that customers spend more money on **{top_category}** "
-                    "compared to the other category.\n"
-                    "- Management could prioritize promotions, inventory, and marketing around "
-                    f"**{top_category}** while exploring why the other category is underperforming."
-                )
-            else:
-                st.info("No sales data found after grouping by category.")
-        else:
-            st.error(
-                "Unable to create the category comparison chart because the required columns "
-                "were not found. Please check that your dataset has 'Category' and '$ Sales' "
-                "or 'Sales' columns."
-            )
+        render_category_tab(df, category_col, sales_col)
 
-    # ============= TAB 2: SALES OVER TIME (TIME SERIES) =============
     with tab2:
-        st.subheader("Question 2: Sales Over Timeline (Daily Sales Trends)")
-
-        if date_col is not None and sales_col is not None:
-            df_time = df.copy()
-
-            # Convert date column to datetime
-            df_time[date_col] = pd.to_datetime(df_time[date_col], errors="coerce")
-
-            # Drop rows where the date failed to convert
-            df_time = df_time.dropna(subset=[date_col])
+        render_daily_sales_tab(df, date_col, sales_col)
 
-            # Group by date and sum sales
-            daily_sales = (
-                df_time.groupby(date_col)[sales_col]
-                .sum()
-                .sort_index()
-            )
-
-            if not daily_sales.empty:
-                fig2, ax2 = plt.subplots()
-                ax2.plot(daily_sales.index, daily_sales.values, marker="o")
-                ax2.set_title("Daily Sales Over Time")
-                ax2.set_xlabel("Date Ordered")
-                ax2.set_ylabel("Total Sales ($)")
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-
-                st.pyplot(fig2)
-
-                st.markdown("**Brief Interpretation**")
-
-                # Basic interpretation: find peaks and overall trend
-                max_date = daily_sales.idxmax()
-                max_value = daily_sales.max()
-                st.write(
-                    f"- The highest daily sales occurred on **{max_date.date()}**, "
-                    f"with total sales of approximately **${max_value:,.2f}**.\n"
-                    "- The chart helps identify busy days, potential promotion effects, or "
-                    "seasonal patterns.\n"
-                    "- Management can use this to schedule staffing, plan inventory, and "
-                    "target marketing campaigns around high-demand periods."
-                )
-            else:
-                st.info("No valid daily sales data after processing the dates.")
-        else:
-            st.error(
-                "Unable to create the time-series chart because the required columns "
-                "('Date Ordered' and 'Sales') were not found."
-            )
-
-    # ============= TAB 3: SERVICE SATISFACTION DISTRIBUTION =============
     with tab3:
-        st.subheader("Question 3: Service Satisfaction Rating Distribution")
-
-        if satisfaction_col is not None:
-            ratings = df[satisfaction_col].dropna()
-
-            if not ratings.empty:
-                # Count each rating (e.g., 1–5)
-                rating_counts = ratings.value_counts().sort_index()
-
-                fig3, ax3 = plt.subplots()
-                ax3.bar(rating_counts.index.astype(str), rating_counts.values)
-                ax3.set_title("Service Satisfaction Rating Distribution")
-                ax3.set_xlabel("Rating Score")
-                ax3.set_ylabel("Number of Customers")
-
-                st.pyplot(fig3)
-
-                most_common_rating = rating_counts.idxmax()
-                st.markdown("**Brief Interpretation**")
-                st.write(
-                    f"- The most common service satisfaction score is **{most_common_rating}**.\n"
-                    "- A higher concentration of ratings at the top end (e.g., 4–5) indicates "
-                    "good customer experience and service quality.\n"
-                    "- If there are many low ratings (1–2), management should investigate "
-                    "pain points such as waiting times, staff behavior, or product quality.\n"
-                    "- This chart supports decisions on staff training, process improvement, "
-                    "and customer service policies."
-                )
-            else:
-                st.info("No non-missing satisfaction ratings available in the dataset.")
-        else:
-            st.error(
-                "Unable to plot satisfaction distribution because the column "
-                "'Service Satisfaction Rating' (or similar) was not found."
-            )
+        render_satisfaction_tab(df, satisfaction_col)
 
 else:
     st.info("👆 Please upload the juice sales dataset to begin the analysis.")